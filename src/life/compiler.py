@@ -16,6 +16,8 @@ Supports dynamic keys: @self.tables.@payload.target.dataset
 - Then resolves @self.tables.clients.dataset
 """
 
+import copy
+import functools
 import re
 from datetime import datetime, timezone
 from pathlib import Path
@@ -29,6 +31,12 @@ from life.schemas import JobInstance, StepInstance
 # Job definitions directory
 JOBS_DIR = Path(__file__).parent / "jobs" / "definitions"
 
+# Pattern for embedded dynamic keys like .@payload.xxx or .@ctx.xxx
+DYNAMIC_KEY_PATTERN = re.compile(r'\.@(ctx|payload)\.([a-zA-Z_][a-zA-Z0-9_]*)')
+
+# libyaml-backed safe loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class CompileError(Exception):
     """Raised when compilation fails."""
@@ -40,12 +48,25 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@functools.lru_cache(maxsize=64)
+def _read_job_yaml(yaml_path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a job definition file, cached until the file changes."""
+    with open(yaml_path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def load_job_yaml(job_id: str) -> Dict[str, Any]:
-    """Load a job definition YAML by ID."""
+    """Load a job definition YAML by ID.
+
+    The parsed YAML is cached per file (keyed on path, mtime and size);
+    each call returns a deep copy, so callers may mutate the result.
+    """
     yaml_path = JOBS_DIR / f"{job_id}.yaml"
-    if not yaml_path.exists():
+    try:
+        stat = yaml_path.stat()
+    except FileNotFoundError:
         raise CompileError(f"Job not found: {job_id}")
-    return yaml.safe_load(yaml_path.read_text())
+    return copy.deepcopy(_read_job_yaml(str(yaml_path), stat.st_mtime_ns, stat.st_size))
 
 
 def compile_job(
@@ -161,10 +182,6 @@ def _expand_dynamic_keys(
     → Split into segments, resolve @payload.target → "clients"
     → "@self.tables.clients.dataset"
     """
-    # Pattern to find embedded refs like .@payload.xxx. or .@ctx.xxx.
-    # We need to find @payload.xxx or @ctx.xxx that appear as path segments
-    pattern = re.compile(r'\.@(ctx|payload)\.([a-zA-Z_][a-zA-Z0-9_]*)')
-
     def replace_dynamic_key(match):
         namespace = match.group(1)
         key = match.group(2)
@@ -179,7 +196,7 @@ def _expand_dynamic_keys(
             raise CompileError(f"Dynamic key must be string or int: @{namespace}.{key}")
         return f".{value}"
 
-    return pattern.sub(replace_dynamic_key, ref)
+    return DYNAMIC_KEY_PATTERN.sub(replace_dynamic_key, ref)
 
 
 def _navigate_reference(
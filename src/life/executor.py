@@ -19,15 +19,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import lorchestra
-from lorchestra import execute as lorchestra_execute
-from lorchestra.pipeline import load_pipeline, run_pipeline as lorchestra_run_pipeline
-
 from life.schemas import JobInstance, StepInstance, StepOutcome, RunRecord
 
-
-# Lorchestra's job definitions directory
-LORCHESTRA_JOBS_DIR = Path(lorchestra.__file__).parent / "jobs" / "definitions"
+# lorchestra is imported lazily inside the lorchestra.run handler: it pulls in
+# a large dependency tree that commands like `life version`, `life jobs` and
+# `life script` (and dry runs) never need.
 
 # Set default storacle namespace if not already set
 if "STORACLE_NAMESPACE_SALT" not in os.environ:
@@ -39,6 +35,13 @@ def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _lorchestra_jobs_dir() -> Path:
+    """Return lorchestra's job definitions directory."""
+    import lorchestra
+
+    return Path(lorchestra.__file__).parent / "jobs" / "definitions"
+
+
 # =============================================================================
 # @run.* Resolution
 # =============================================================================
@@ -47,6 +50,9 @@ def _utcnow() -> datetime:
 # Supports array indexing: @run.step_id.items[0].field
 RUN_REF_PATTERN = re.compile(r"@run\.([a-zA-Z_][a-zA-Z0-9_.\[\]]*)")
 
+# Pattern for an indexed path segment: items[0]
+RUN_INDEX_PATTERN = re.compile(r"(\w+)\[(\d+)\]")
+
 
 def _resolve_run_refs(value: Any, step_outputs: Dict[str, Any]) -> Any:
     """
@@ -69,7 +75,7 @@ def _resolve_run_refs(value: Any, step_outputs: Dict[str, Any]) -> Any:
                 result = step_outputs[step_id]
                 for part in parts[1:]:
                     # Handle array indexing: items[0]
-                    array_match = re.match(r"(\w+)\[(\d+)\]", part)
+                    array_match = RUN_INDEX_PATTERN.match(part)
                     if array_match:
                         key, idx = array_match.groups()
                         if isinstance(result, dict) and key in result:
@@ -173,8 +179,12 @@ def _handle_lorchestra_run(step_id: str, params: Dict[str, Any], ctx: Dict[str,
                     output={"dry_run": True, "pipeline_id": pipeline_id},
                 )
 
-            spec = load_pipeline(pipeline_id, LORCHESTRA_JOBS_DIR)
-            result = lorchestra_run_pipeline(spec, smoke_namespace=smoke_namespace, definitions_dir=LORCHESTRA_JOBS_DIR)
+            from lorchestra.pipeline import load_pipeline
+            from lorchestra.pipeline import run_pipeline as lorchestra_run_pipeline
+
+            jobs_dir = _lorchestra_jobs_dir()
+            spec = load_pipeline(pipeline_id, jobs_dir)
+            result = lorchestra_run_pipeline(spec, smoke_namespace=smoke_namespace, definitions_dir=jobs_dir)
             return StepOutcome(
                 step_id=step_id,
                 status="completed" if result.success else "failed",
@@ -193,11 +203,13 @@ def _handle_lorchestra_run(step_id: str, params: Dict[str, Any], ctx: Dict[str,
                     output={"dry_run": True, "job_id": job_id, "payload": job_payload},
                 )
 
+            from lorchestra import execute as lorchestra_execute
+
             envelope = {
                 "job_id": job_id,
                 "payload": job_payload,
                 "ctx": {"source": "life-cli"},
-                "definitions_dir": LORCHESTRA_JOBS_DIR,
+                "definitions_dir": _lorchestra_jobs_dir(),
             }
 
             result = lorchestra_execute(envelope)
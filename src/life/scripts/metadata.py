@@ -6,11 +6,13 @@ Copyright 2025 Ben Mensi
 Licensed under the Apache License, Version 2.0
 """
 
+import copy
+import functools
 import re
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 import yaml
 
@@ -24,6 +26,9 @@ class ScriptValidationError(Exception):
 # Script name pattern: lowercase alphanumeric with hyphens only
 NAME_PATTERN = re.compile(r"^[a-z0-9-]+$")
 
+# libyaml-backed safe loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class ScriptMetadata:
@@ -122,6 +127,18 @@ def validate_name(name: str) -> None:
         )
 
 
+@functools.lru_cache(maxsize=256)
+def _read_meta_file(meta_path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a metadata YAML file.
+
+    Cached on (path, mtime_ns, size) so repeated lookups of an unchanged
+    file skip the YAML parse, while any edit invalidates the entry. The
+    result is shared; callers must copy it before handing it out.
+    """
+    with open(meta_path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def load_metadata(
     name: str, search_paths: List[Path]
 ) -> Tuple[Path, ScriptMetadata]:
@@ -162,8 +179,10 @@ def load_metadata(
 
             # Parse metadata
             try:
-                with open(meta_path) as f:
-                    data = yaml.safe_load(f)
+                stat = meta_path.stat()
+                data = copy.deepcopy(
+                    _read_meta_file(str(meta_path), stat.st_mtime_ns, stat.st_size)
+                )
             except yaml.YAMLError as e:
                 raise ScriptValidationError(f"invalid YAML in {meta_path}: {e}")
 
@@ -6,16 +6,16 @@ Copyright 2025 Ben Mensi
 Licensed under the Apache License, Version 2.0
 """
 
+import functools
 import hashlib
 import os
-import subprocess
 import sys
+import time
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from life.event_client import EventClient
 from life.scripts.metadata import ScriptValidationError, load_metadata
 from life.scripts.state import (
     ScriptTier,
@@ -25,6 +25,18 @@ from life.scripts.state import (
     save_state,
 )
 
+# subprocess, the event client and the thread pool are only needed once a
+# script is run or listed; import them there to keep module import light
+if TYPE_CHECKING:
+    import subprocess
+
+    from life.event_client import EventClient
+
+
+# Default search locations; ~ is expanded once at import rather than per call
+_USER_SCRIPTS_DIR = Path("~/.life/scripts").expanduser()
+_REPO_SCRIPTS_DIR = Path("./scripts")
+
 
 class ScriptExecutionError(Exception):
     """Raised when script execution fails."""
@@ -57,10 +69,10 @@ def get_search_paths() -> List[Path]:
         paths.append(Path(env_dir))
 
     # 2. User-local default
-    paths.append(Path("~/.life/scripts").expanduser())
+    paths.append(_USER_SCRIPTS_DIR)
 
     # 3. Repo-local (rare)
-    paths.append(Path("./scripts"))
+    paths.append(_REPO_SCRIPTS_DIR)
 
     return paths
 
@@ -74,15 +86,23 @@ def _get_dir_scope(script_path: Path) -> str:
     env_dir = os.environ.get("LIFE_SCRIPTS_DIR")
     if env_dir and script_path.is_relative_to(Path(env_dir)):
         return "env"
-    user_dir = Path("~/.life/scripts").expanduser()
-    if script_path.is_relative_to(user_dir):
+    if script_path.is_relative_to(_USER_SCRIPTS_DIR):
         return "user"
     return "repo"
 
 
 def _hash_args(args: List[str]) -> str:
-    """Create a SHA256 hash of the arguments."""
-    return hashlib.sha256(" ".join(args).encode()).hexdigest()
+    """Create a BLAKE2b hash of the arguments.
+
+    The digest only groups runs in the event log; it is not a security
+    primitive, so a faster hash than SHA256 is fine here. Each argument is
+    NUL-terminated, so ["a b"] and ["a", "b"] hash differently.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for arg in args:
+        h.update(arg.encode())
+        h.update(b"\0")
+    return h.hexdigest()
 
 
 def _redact_args(args: List[str]) -> List[str]:
@@ -90,25 +110,57 @@ def _redact_args(args: List[str]) -> List[str]:
 
     Example: ["--source", "secret", "--dry-run"] -> ["--source", "--dry-run"]
     """
-    redacted = []
-    for arg in args:
-        if arg.startswith("-"):
-            # Split on = for --key=value format
-            redacted.append(arg.split("=")[0])
-    return redacted
+    # partition on = for --key=value format
+    return [arg.partition("=")[0] for arg in args if arg.startswith("-")]
+
 
+@functools.lru_cache(maxsize=1)
+def _get_event_client() -> "EventClient":
+    """Get the event client for logging (created once per process)."""
+    from life.event_client import EventClient
 
-def _get_event_client() -> EventClient:
-    """Get the event client for logging."""
     log_path = Path("~/.life/events.jsonl").expanduser()
     return EventClient(log_path)
 
 
+@functools.lru_cache(maxsize=1)
 def _check_tty() -> bool:
-    """Check if stdin is a TTY."""
+    """Check if stdin is a TTY (checked once per process)."""
     return sys.stdin.isatty()
 
 
+def _execute(
+    script_path: Path, args: List[str], env: Dict[str, str]
+) -> "subprocess.CompletedProcess":
+    """Execute a script under bash strict mode.
+
+    Invokes bash on the script file directly (no -c string to parse, no
+    shell quoting of the path) and skips startup files. Output is captured
+    so the caller can forward it to stdout/stderr.
+
+    Args:
+        script_path: Path to the .sh file.
+        args: Arguments to pass to the script.
+        env: Environment for the script process.
+
+    Returns:
+        Completed process with returncode, stdout and stderr.
+    """
+    import subprocess
+
+    return subprocess.run(
+        [
+            "bash", "--noprofile", "--norc",
+            "-o", "errexit", "-o", "nounset", "-o", "pipefail",
+            str(script_path), *args,
+        ],
+        env=env,
+        cwd=script_path.parent,
+        capture_output=True,
+        text=True,
+    )
+
+
 def _prompt_confirmation(message: str) -> bool:
     """Prompt user for yes/no confirmation.
 
@@ -160,8 +212,9 @@ def run_script(
     state = load_state(name)
 
     # Calculate age and tier
-    tier = calculate_tier(metadata, state)
-    age_days = get_age_days(metadata, state)
+    checked_at = datetime.now(timezone.utc)
+    tier = calculate_tier(metadata, state, now=checked_at)
+    age_days = get_age_days(metadata, state, now=checked_at)
 
     # Emit started event
     event_client.log_event(
@@ -176,7 +229,7 @@ def run_script(
             "args_redacted": _redact_args(args),
             "owner": metadata.owner,
             "age_days": age_days,
-            "tier": tier.value,
+            "tier": str(tier),
             "promotion_target": metadata.promotion_target,
         },
     )
@@ -255,22 +308,15 @@ def run_script(
             )
 
         # Execute script
-        start_time = datetime.now(timezone.utc)
+        start_ns = time.monotonic_ns()
 
         # Build controlled environment
         env = os.environ.copy()
         env["LIFE_CORRELATION_ID"] = correlation_id
+        # Non-interactive bash still sources $BASH_ENV; skip it
+        env["BASH_ENV"] = ""
 
-        # Run script with strict mode enforced
-        # Use bash -c with explicit set -euo pipefail then source the script
-        # Capture output and forward to stdout/stderr so tests can assert on it
-        result = subprocess.run(
-            ["bash", "-c", f"set -euo pipefail; source {script_path}", "--", *args],
-            env=env,
-            cwd=script_path.parent,
-            capture_output=True,
-            text=True,
-        )
+        result = _execute(script_path, args, env)
 
         # Pass through captured output (if any)
         if result.stdout:
@@ -278,7 +324,7 @@ def run_script(
         if result.stderr:
             print(result.stderr, end="", file=sys.stderr)
 
-        duration_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
+        duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
         # Update state
         now = datetime.now(timezone.utc).isoformat()
@@ -322,18 +368,20 @@ def run_script(
             payload={
                 "script": name,
                 "age_days": age_days,
-                "tier": tier.value,
+                "tier": str(tier),
             },
-            error_message=f"Script blocked due to TTL tier: {tier.value}",
+            error_message=f"Script blocked due to TTL tier: {tier!s}",
         )
         raise
 
 
-def get_script_info(name: str) -> dict:
+def get_script_info(name: str, now: Optional[datetime] = None) -> dict:
     """Get information about a script.
 
     Args:
         name: Script name.
+        now: Current UTC time used for age and tier. Defaults to the
+            time of the call.
 
     Returns:
         Dictionary with script metadata, state, and tier information.
@@ -341,8 +389,10 @@ def get_script_info(name: str) -> dict:
     search_paths = get_search_paths()
     script_path, metadata = load_metadata(name, search_paths)
     state = load_state(name)
-    tier = calculate_tier(metadata, state)
-    age_days = get_age_days(metadata, state)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    tier = calculate_tier(metadata, state, now=now)
+    age_days = get_age_days(metadata, state, now=now)
 
     return {
         "name": name,
@@ -354,7 +404,7 @@ def get_script_info(name: str) -> dict:
         "promotion_target": metadata.promotion_target,
         "calls": metadata.calls,
         "age_days": age_days,
-        "tier": tier.value,
+        "tier": str(tier),
         "run_count": state.run_count,
         "force_count": state.force_count,
         "first_seen": state.first_seen,
@@ -362,13 +412,25 @@ def get_script_info(name: str) -> dict:
     }
 
 
+def _get_script_info_or_none(name: str, now: datetime) -> Optional[dict]:
+    """Get script info, or None if the script's metadata is invalid."""
+    try:
+        return get_script_info(name, now=now)
+    except ScriptValidationError:
+        return None
+
+
 def list_scripts() -> List[dict]:
     """List all available scripts in search paths.
 
+    Metadata for each script is loaded on a small thread pool, since every
+    entry is I/O bound (stat + file read + YAML parse). Results keep the
+    directory order, and every script is aged against the same clock read.
+
     Returns:
         List of script info dictionaries.
     """
-    scripts = []
+    names = []
 
     env_dir = os.environ.get("LIFE_SCRIPTS_DIR")
     if env_dir:
@@ -382,12 +444,16 @@ def list_scripts() -> List[dict]:
             continue
 
         for meta_file in search_path.glob("*.meta.yaml"):
-            name = meta_file.stem.replace(".meta", "")
-            try:
-                info = get_script_info(name)
-                scripts.append(info)
-            except ScriptValidationError:
-                # Skip invalid scripts
-                continue
-
-    return scripts
+            names.append(meta_file.stem.replace(".meta", ""))
+
+    if not names:
+        return []
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    load_info = functools.partial(
+        _get_script_info_or_none, now=datetime.now(timezone.utc)
+    )
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+        # Skip invalid scripts
+        return [info for info in pool.map(load_info, names) if info]
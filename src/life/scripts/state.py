@@ -7,9 +7,11 @@ Licensed under the Apache License, Version 2.0
 """
 
 import json
+import os
+import tempfile
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from enum import Enum
+from enum import IntEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -17,19 +19,35 @@ if TYPE_CHECKING:
     from life.scripts.metadata import ScriptMetadata
 
 
-class ScriptTier(Enum):
+class ScriptTier(IntEnum):
     """TTL-based script age tiers.
 
     < 1×TTL: fresh - Normal execution
     1×TTL – 2×TTL: stale - Warning shown
     2×TTL – 3×TTL: overdue - Confirmation required (--yes bypasses)
     > 3×TTL: blocked - Hard block (only --force bypasses)
+
+    Members are ordered ints (tier comparisons are integer compares);
+    str(tier) gives the lowercase name used in events and script info.
+    Note that tier.value and json.dumps(tier) give the int (0-3), not the
+    label. ScriptTier("stale") still works for callers passing the old
+    string values.
     """
 
-    FRESH = "fresh"
-    STALE = "stale"
-    OVERDUE = "overdue"
-    BLOCKED = "blocked"
+    FRESH = 0
+    STALE = 1
+    OVERDUE = 2
+    BLOCKED = 3
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["ScriptTier"]:
+        # Accept the lowercase string labels tiers used to have as values
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
 
 
 @dataclass
@@ -64,19 +82,24 @@ def load_state(name: str) -> ScriptState:
         ScriptState, or empty state if file doesn't exist.
     """
     state_file = _state_dir() / f"{name}.json"
-    if not state_file.exists():
+    try:
+        raw = state_file.read_bytes()
+    except FileNotFoundError:
+        return ScriptState()
+
+    # Anything that isn't a JSON object is corrupt; skip the parser entirely
+    if not raw.lstrip().startswith(b"{"):
         return ScriptState()
 
     try:
-        with open(state_file) as f:
-            data = json.load(f)
+        data = json.loads(raw)
         return ScriptState(
             first_seen=data.get("first_seen"),
             last_run=data.get("last_run"),
             run_count=data.get("run_count", 0),
             force_count=data.get("force_count", 0),
         )
-    except (json.JSONDecodeError, TypeError):
+    except (ValueError, TypeError):
         # Corrupted state file - return empty state
         return ScriptState()
 
@@ -84,6 +107,11 @@ def load_state(name: str) -> ScriptState:
 def save_state(name: str, state: ScriptState) -> None:
     """Save script state to ~/.life/state/scripts/<name>.json.
 
+    Writes to a uniquely named temp file in the state directory, fsyncs,
+    then renames over the old file, so a crash mid-write never leaves a
+    truncated state file behind and overlapping runs never share a temp
+    file.
+
     Args:
         name: Script name.
         state: State to save.
@@ -92,11 +120,30 @@ def save_state(name: str, state: ScriptState) -> None:
     state_dir.mkdir(parents=True, exist_ok=True)
 
     state_file = state_dir / f"{name}.json"
-    with open(state_file, "w") as f:
-        json.dump(asdict(state), f, indent=2)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=state_dir, prefix=f".{name}.", suffix=".tmp", delete=False
+    ) as f:
+        tmp_file = Path(f.name)
+        try:
+            json.dump(asdict(state), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            tmp_file.unlink(missing_ok=True)
+            raise
+    try:
+        os.replace(tmp_file, state_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
 
 
-def calculate_tier(metadata: "ScriptMetadata", state: ScriptState) -> ScriptTier:
+def calculate_tier(
+    metadata: "ScriptMetadata",
+    state: ScriptState,
+    now: Optional[datetime] = None,
+) -> ScriptTier:
     """Calculate the TTL tier for a script.
 
     Uses max(created_at, first_seen) to prevent gaming by editing created_at.
@@ -104,11 +151,14 @@ def calculate_tier(metadata: "ScriptMetadata", state: ScriptState) -> ScriptTier
     Args:
         metadata: Script metadata containing created_at and ttl_days.
         state: Script state containing first_seen.
+        now: Current UTC time; pass it in to share one clock read across
+            several scripts. Defaults to datetime.now(timezone.utc).
 
     Returns:
         ScriptTier indicating the current age tier.
     """
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     ttl_days = metadata.ttl_days
 
     # Determine base date: max(created_at, first_seen)
@@ -140,7 +190,11 @@ def calculate_tier(metadata: "ScriptMetadata", state: ScriptState) -> ScriptTier
         return ScriptTier.BLOCKED
 
 
-def get_age_days(metadata: "ScriptMetadata", state: ScriptState) -> int:
+def get_age_days(
+    metadata: "ScriptMetadata",
+    state: ScriptState,
+    now: Optional[datetime] = None,
+) -> int:
     """Get the age of a script in days.
 
     Uses max(created_at, first_seen) as the base date.
@@ -148,11 +202,13 @@ def get_age_days(metadata: "ScriptMetadata", state: ScriptState) -> int:
     Args:
         metadata: Script metadata containing created_at.
         state: Script state containing first_seen.
+        now: Current UTC time. Defaults to datetime.now(timezone.utc).
 
     Returns:
         Age in days.
     """
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
 
     created_dt = datetime.combine(
         metadata.created_at, datetime.min.time(), tzinfo=timezone.utc
@@ -88,3 +88,15 @@ def sample_state() -> Dict[str, Any]:
             "last_run": "2024-11-10T09:00:00Z",
         },
     }
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The life Typer app, imported on first use.
+
+    Keeps life.cli (and everything it pulls in) out of collection for test
+    runs that never invoke the CLI.
+    """
+    from life.cli import app as life_app
+
+    return life_app
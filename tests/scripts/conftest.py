@@ -0,0 +1,29 @@
+"""Shared fixtures for script runner tests."""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+class _Recorder:
+    """Minimal event client that records log_event keyword arguments."""
+
+    def __init__(self):
+        self.events = []
+
+    def log_event(self, **kwargs):
+        self.events.append(kwargs)
+
+
+@pytest.fixture
+def scripts_runtime(tmp_path, monkeypatch):
+    """Isolate script state and events for one test.
+
+    Points the state directory at tmp_path/state and swaps the event client
+    for a _Recorder. Returns a namespace with tmp, state_dir and client.
+    """
+    state_dir = tmp_path / "state"
+    client = _Recorder()
+    monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
+    monkeypatch.setattr("life.scripts.runner._get_event_client", lambda: client)
+    return SimpleNamespace(tmp=tmp_path, state_dir=state_dir, client=client)
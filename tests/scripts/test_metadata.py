@@ -2,8 +2,6 @@
 
 import pytest
 from datetime import date
-from pathlib import Path
-import tempfile
 
 from life.scripts.metadata import (
     ScriptMetadata,
@@ -348,3 +346,46 @@ promotion_target: job/target
         # Should find it in tmp_path even though nonexistent is first
         script_path, metadata = load_metadata("test", [nonexistent, tmp_path])
         assert metadata.name == "test"
+
+    def test_reloads_after_metadata_edit(self, tmp_path):
+        """Cached metadata should be re-read once the file changes."""
+        script_file = tmp_path / "edited.sh"
+        script_file.write_text("#!/bin/bash")
+
+        meta_file = tmp_path / "edited.meta.yaml"
+        meta_template = """
+name: edited
+description: {description}
+owner: "@user"
+created_at: 2025-01-01
+ttl_days: 14
+promotion_target: job/target
+"""
+        meta_file.write_text(meta_template.format(description="Before"))
+        _, metadata = load_metadata("edited", [tmp_path])
+        assert metadata.description == "Before"
+
+        meta_file.write_text(meta_template.format(description="After edit"))
+        _, metadata = load_metadata("edited", [tmp_path])
+        assert metadata.description == "After edit"
+
+    def test_load_returns_independent_copies(self, tmp_path):
+        """Mutating loaded metadata should not affect later loads."""
+        (tmp_path / "copied.sh").write_text("#!/bin/bash")
+        (tmp_path / "copied.meta.yaml").write_text("""
+name: copied
+description: Test
+owner: "@user"
+created_at: 2025-01-01
+ttl_days: 14
+promotion_target: job/target
+calls:
+  - job/one
+""")
+
+        _, first = load_metadata("copied", [tmp_path])
+        first.calls.append("job/extra")
+
+        _, second = load_metadata("copied", [tmp_path])
+        assert second.calls == ["job/one"]
+        assert second.calls is not first.calls
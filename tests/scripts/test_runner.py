@@ -1,11 +1,10 @@
 """Tests for script runner."""
 
 import json
-import os
+import subprocess
 import pytest
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, timedelta
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 from life.scripts.runner import (
     ScriptBlockedError,
@@ -20,6 +19,60 @@ from life.scripts.runner import (
 from life.scripts.metadata import ScriptValidationError
 
 
+_SHEBANG = b"#!/bin/bash\n"
+_ECHO_HELLO = _SHEBANG + b"echo hello"
+
+_META_TEMPLATE = (
+    "name: {name}\n"
+    "description: {description}\n"
+    'owner: "@testuser"\n'
+    "created_at: {created_at}\n"
+    "ttl_days: {ttl_days}\n"
+    "promotion_target: job/test-target\n"
+)
+
+
+class _FakeExecute:
+    """In-process stand-in for runner._execute (no bash fork)."""
+
+    def __init__(self):
+        self.returncode = 0
+        self.calls = []
+
+    def __call__(self, script_path, args, env):
+        self.calls.append((script_path, list(args)))
+        return subprocess.CompletedProcess(
+            [str(script_path), *args], self.returncode, stdout="", stderr=""
+        )
+
+
+@pytest.fixture
+def fake_execute(monkeypatch):
+    """Replace script execution with _FakeExecute for the test."""
+    fake = _FakeExecute()
+    monkeypatch.setattr("life.scripts.runner._execute", fake)
+    return fake
+
+
+@pytest.fixture(scope="class")
+def scripts_dir(tmp_path_factory):
+    """Scripts directory shared across a test class, one script per TTL tier.
+
+    Scripts are read-only here; state lives in each test's tmp_path.
+    """
+    scripts_dir = tmp_path_factory.mktemp("scripts")
+    for name, created_days_ago in (
+        ("test-fresh", 5),
+        ("test-stale", 40),
+        ("test-overdue", 70),
+        ("test-blocked", 100),
+    ):
+        TestRunScript._create_script(
+            scripts_dir, name, ttl_days=30, created_days_ago=created_days_ago
+        )
+    return scripts_dir
+
+
 class TestGetSearchPaths:
     """Tests for get_search_paths function."""
 
@@ -57,6 +110,10 @@ class TestHelperFunctions:
         assert hash1 == hash2
         assert hash1 != hash3
 
+    def test_hash_args_keeps_argument_boundaries(self):
+        """Arguments containing spaces should not collide with split ones."""
+        assert _hash_args(["a b"]) != _hash_args(["a", "b"])
+
     def test_redact_args(self):
         """Should extract only flag names."""
         args = ["--source", "secret-value", "--dry-run", "--env=prod", "positional"]
@@ -64,6 +121,10 @@ class TestHelperFunctions:
 
         assert redacted == ["--source", "--dry-run", "--env"]
 
+    def test_redact_args_keeps_short_flags(self):
+        """Single-dash flags should be kept as flag names too."""
+        assert _redact_args(["-v", "-o=out.json", "value"]) == ["-v", "-o"]
+
     def test_get_dir_scope_env(self, monkeypatch, tmp_path):
         """Should detect env scope."""
         monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
@@ -95,161 +156,103 @@ class TestHelperFunctions:
 class TestRunScript:
     """Tests for run_script function."""
 
-    def _create_script(self, tmp_path, name, ttl_days=30, created_days_ago=0, script_content="echo hello"):
+    @staticmethod
+    def _create_script(tmp_path, name, ttl_days=30, created_days_ago=0, script_content="echo hello"):
         """Helper to create a valid script with metadata."""
         created_at = date.today() - timedelta(days=created_days_ago)
 
         script_file = tmp_path / f"{name}.sh"
-        script_file.write_text(f"#!/bin/bash\n{script_content}")
+        script_file.write_bytes(_SHEBANG + script_content.encode())
 
         meta_file = tmp_path / f"{name}.meta.yaml"
-        meta_file.write_text(f"""
-name: {name}
-description: Test script
-owner: "@testuser"
-created_at: {created_at.isoformat()}
-ttl_days: {ttl_days}
-promotion_target: job/test-target
-""")
+        meta_file.write_bytes(_META_TEMPLATE.format(
+            name=name,
+            description="Test script",
+            created_at=created_at.isoformat(),
+            ttl_days=ttl_days,
+        ).encode())
 
         return script_file
 
-    def test_run_fresh_script(self, tmp_path, monkeypatch):
+    def test_run_fresh_script(self, scripts_dir, fake_execute, scripts_runtime, monkeypatch):
         """Should run fresh script without warnings."""
-        self._create_script(tmp_path, "test-script", ttl_days=30, created_days_ago=5)
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
-
-        # Mock state directory
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
 
-        # Mock event client
-        events_file = tmp_path / "events.jsonl"
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: MagicMock()
-        )
-
-        exit_code = run_script("test-script")
+        exit_code = run_script("test-fresh")
 
         assert exit_code == 0
+        assert [path.name for path, _ in fake_execute.calls] == ["test-fresh.sh"]
 
-    def test_run_stale_script_shows_warning(self, tmp_path, monkeypatch, capsys):
+    def test_run_stale_script_shows_warning(
+        self, scripts_dir, fake_execute, scripts_runtime, monkeypatch, capsys
+    ):
         """Should show warning for stale script."""
-        self._create_script(tmp_path, "test-script", ttl_days=30, created_days_ago=40)
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
 
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: MagicMock()
-        )
-
-        exit_code = run_script("test-script")
+        exit_code = run_script("test-stale")
 
         assert exit_code == 0
         captured = capsys.readouterr()
         assert "stale" in captured.out.lower()
 
-    def test_run_overdue_script_non_tty_without_yes(self, tmp_path, monkeypatch):
+    def test_run_overdue_script_non_tty_without_yes(
+        self, scripts_dir, scripts_runtime, monkeypatch
+    ):
         """Should block overdue script in non-TTY without --yes."""
-        self._create_script(tmp_path, "test-script", ttl_days=30, created_days_ago=70)
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
-
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: MagicMock()
-        )
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
         monkeypatch.setattr("life.scripts.runner._check_tty", lambda: False)
 
         with pytest.raises(ScriptBlockedError, match="Non-interactive"):
-            run_script("test-script")
+            run_script("test-overdue")
 
-    def test_run_overdue_script_with_yes(self, tmp_path, monkeypatch, capsys):
+    def test_run_overdue_script_with_yes(
+        self, scripts_dir, fake_execute, scripts_runtime, monkeypatch, capsys
+    ):
         """Should allow overdue script with --yes."""
-        self._create_script(tmp_path, "test-script", ttl_days=30, created_days_ago=70)
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
 
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: MagicMock()
-        )
-
-        exit_code = run_script("test-script", yes=True)
+        exit_code = run_script("test-overdue", yes=True)
 
         assert exit_code == 0
         captured = capsys.readouterr()
         assert "overdue" in captured.out.lower()
 
-    def test_run_blocked_script_without_force(self, tmp_path, monkeypatch):
+    def test_run_blocked_script_without_force(self, scripts_dir, scripts_runtime, monkeypatch):
         """Should block script over 3x TTL without --force."""
-        self._create_script(tmp_path, "test-script", ttl_days=30, created_days_ago=100)
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
-
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: MagicMock()
-        )
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
 
         with pytest.raises(ScriptBlockedError, match="blocked"):
-            run_script("test-script")
+            run_script("test-blocked")
 
-    def test_run_blocked_script_yes_not_sufficient(self, tmp_path, monkeypatch):
+    def test_run_blocked_script_yes_not_sufficient(self, scripts_dir, scripts_runtime, monkeypatch):
         """Should NOT allow blocked script with only --yes."""
-        self._create_script(tmp_path, "test-script", ttl_days=30, created_days_ago=100)
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
-
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: MagicMock()
-        )
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
 
         with pytest.raises(ScriptBlockedError, match="--yes is not sufficient"):
-            run_script("test-script", yes=True)
+            run_script("test-blocked", yes=True)
 
-    def test_run_blocked_script_with_force(self, tmp_path, monkeypatch, capsys):
+    def test_run_blocked_script_with_force(
+        self, scripts_dir, fake_execute, scripts_runtime, monkeypatch, capsys
+    ):
         """Should allow blocked script with --force."""
-        self._create_script(tmp_path, "test-script", ttl_days=30, created_days_ago=100)
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
 
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: MagicMock()
-        )
-
-        exit_code = run_script("test-script", force=True)
+        exit_code = run_script("test-blocked", force=True)
 
         assert exit_code == 0
         captured = capsys.readouterr()
         assert "blocked" in captured.out.lower()
 
-    def test_run_script_with_args(self, tmp_path, monkeypatch, capsys):
-        """Should pass arguments to script."""
+    @pytest.mark.slow
+    def test_run_script_with_args(self, scripts_runtime, monkeypatch, capsys):
+        """Should pass arguments to script (end-to-end through real bash)."""
         self._create_script(
-            tmp_path, "test-script",
+            scripts_runtime.tmp, "test-script",
             ttl_days=30,
             created_days_ago=5,
             script_content='echo "args: $@"'
         )
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
-
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: MagicMock()
-        )
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_runtime.tmp))
 
         exit_code = run_script("test-script", args=["--foo", "bar"])
 
@@ -258,23 +261,17 @@ promotion_target: job/test-target
         assert "--foo" in captured.out
         assert "bar" in captured.out
 
-    def test_run_script_updates_state(self, tmp_path, monkeypatch):
+    def test_run_script_updates_state(
+        self, scripts_dir, fake_execute, scripts_runtime, monkeypatch
+    ):
         """Should update script state after run."""
-        self._create_script(tmp_path, "test-script", ttl_days=30, created_days_ago=5)
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
-
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: MagicMock()
-        )
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
 
         # First run
-        run_script("test-script")
+        run_script("test-fresh")
 
         # Check state file was created
-        state_file = state_dir / "test-script.json"
+        state_file = scripts_runtime.state_dir / "test-fresh.json"
         assert state_file.exists()
 
         with open(state_file) as f:
@@ -285,91 +282,59 @@ promotion_target: job/test-target
         assert state["last_run"] is not None
 
         # Second run
-        run_script("test-script")
+        run_script("test-fresh")
 
         with open(state_file) as f:
             state = json.load(f)
 
         assert state["run_count"] == 2
 
-    def test_run_script_emits_events(self, tmp_path, monkeypatch):
+    def test_run_script_emits_events(self, scripts_dir, fake_execute, scripts_runtime, monkeypatch):
         """Should emit script.started and script.completed events."""
-        self._create_script(tmp_path, "test-script", ttl_days=30, created_days_ago=5)
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
 
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-
-        mock_client = MagicMock()
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: mock_client
-        )
+        run_script("test-fresh")
 
-        run_script("test-script")
-
-        # Should have called log_event at least twice (started, completed)
-        assert mock_client.log_event.call_count >= 2
+        # Should have logged at least two events (started, completed)
+        events = scripts_runtime.client.events
+        assert len(events) >= 2
 
         # Check for started event
-        calls = mock_client.log_event.call_args_list
-        started_call = [c for c in calls if c.kwargs.get("event_type") == "script.started"]
-        assert len(started_call) == 1
-        assert started_call[0].kwargs["payload"]["script"] == "test-script"
+        started = [e for e in events if e["event_type"] == "script.started"]
+        assert len(started) == 1
+        assert started[0]["payload"]["script"] == "test-fresh"
 
         # Check for completed event
-        completed_call = [c for c in calls if c.kwargs.get("event_type") == "script.completed"]
-        assert len(completed_call) == 1
+        completed = [e for e in events if e["event_type"] == "script.completed"]
+        assert len(completed) == 1
 
-    def test_run_script_emits_override_event(self, tmp_path, monkeypatch):
+    def test_run_script_emits_override_event(
+        self, scripts_dir, fake_execute, scripts_runtime, monkeypatch
+    ):
         """Should emit script.override.forced event when force is used."""
-        self._create_script(tmp_path, "test-script", ttl_days=30, created_days_ago=100)
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
-
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-
-        mock_client = MagicMock()
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: mock_client
-        )
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
 
-        run_script("test-script", force=True)
+        run_script("test-blocked", force=True)
 
         # Check for override event
-        calls = mock_client.log_event.call_args_list
-        override_call = [c for c in calls if c.kwargs.get("event_type") == "script.override.forced"]
-        assert len(override_call) == 1
-        assert override_call[0].kwargs["payload"]["reason"] == "force"
+        events = scripts_runtime.client.events
+        override = [e for e in events if e["event_type"] == "script.override.forced"]
+        assert len(override) == 1
+        assert override[0]["payload"]["reason"] == "force"
 
-    def test_run_failing_script(self, tmp_path, monkeypatch, capsys):
+    def test_run_failing_script(self, scripts_dir, fake_execute, scripts_runtime, monkeypatch):
         """Should handle script that exits with error."""
-        self._create_script(
-            tmp_path, "fail-script",
-            ttl_days=30,
-            created_days_ago=5,
-            script_content="exit 1"
-        )
-        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(tmp_path))
-
-        state_dir = tmp_path / "state"
-        monkeypatch.setattr("life.scripts.state._state_dir", lambda: state_dir)
-
-        mock_client = MagicMock()
-        monkeypatch.setattr(
-            "life.scripts.runner._get_event_client",
-            lambda: mock_client
-        )
+        fake_execute.returncode = 1
+        monkeypatch.setenv("LIFE_SCRIPTS_DIR", str(scripts_dir))
 
-        exit_code = run_script("fail-script")
+        exit_code = run_script("test-fresh")
 
         assert exit_code == 1
 
         # Should have emitted script.failed event
-        calls = mock_client.log_event.call_args_list
-        failed_call = [c for c in calls if c.kwargs.get("event_type") == "script.failed"]
-        assert len(failed_call) == 1
+        events = scripts_runtime.client.events
+        failed = [e for e in events if e["event_type"] == "script.failed"]
+        assert len(failed) == 1
 
     def test_invalid_script_name(self, tmp_path, monkeypatch):
         """Should reject invalid script name."""
@@ -398,19 +363,15 @@ class TestGetScriptInfo:
         created_at = date.today() - timedelta(days=created_days_ago)
 
         script_file = tmp_path / f"{name}.sh"
-        script_file.write_text("#!/bin/bash\necho hello")
+        script_file.write_bytes(_ECHO_HELLO)
 
         meta_file = tmp_path / f"{name}.meta.yaml"
-        meta_file.write_text(f"""
-name: {name}
-description: Test script description
-owner: "@testuser"
-created_at: {created_at.isoformat()}
-ttl_days: {ttl_days}
-promotion_target: job/test-target
-calls:
-  - job/step-one
-""")
+        meta_file.write_bytes(_META_TEMPLATE.format(
+            name=name,
+            description="Test script description",
+            created_at=created_at.isoformat(),
+            ttl_days=ttl_days,
+        ).encode() + b"calls:\n  - job/step-one\n")
 
     def test_get_script_info(self, tmp_path, monkeypatch):
         """Should return complete script info."""
@@ -440,17 +401,15 @@ class TestListScripts:
         created_at = date.today() - timedelta(days=created_days_ago)
 
         script_file = tmp_path / f"{name}.sh"
-        script_file.write_text("#!/bin/bash\necho hello")
+        script_file.write_bytes(_ECHO_HELLO)
 
         meta_file = tmp_path / f"{name}.meta.yaml"
-        meta_file.write_text(f"""
-name: {name}
-description: Test script
-owner: "@testuser"
-created_at: {created_at.isoformat()}
-ttl_days: {ttl_days}
-promotion_target: job/test-target
-""")
+        meta_file.write_bytes(_META_TEMPLATE.format(
+            name=name,
+            description="Test script",
+            created_at=created_at.isoformat(),
+            ttl_days=ttl_days,
+        ).encode())
 
     def test_list_scripts_empty(self, tmp_path, monkeypatch):
         """Should return empty list when no scripts."""
@@ -1,10 +1,8 @@
 """Tests for script state management."""
 
+import os
 import pytest
-import json
 from datetime import date, datetime, timezone, timedelta
-from pathlib import Path
-from unittest.mock import patch
 
 from life.scripts.metadata import ScriptMetadata
 from life.scripts.state import (
@@ -17,6 +15,24 @@ from life.scripts.state import (
 )
 
 
+class TestScriptTier:
+    """Tests for ScriptTier enum."""
+
+    def test_str_is_lowercase_label(self):
+        """str() should give the label used in events."""
+        assert str(ScriptTier.OVERDUE) == "overdue"
+
+    def test_accepts_legacy_string_values(self):
+        """Lookup by the old string values should still resolve."""
+        assert ScriptTier("stale") is ScriptTier.STALE
+        assert ScriptTier(3) is ScriptTier.BLOCKED
+
+    def test_rejects_unknown_label(self):
+        """Unknown labels should raise ValueError."""
+        with pytest.raises(ValueError):
+            ScriptTier("ancient")
+
+
 class TestScriptState:
     """Tests for ScriptState dataclass."""
 
@@ -99,6 +115,19 @@ class TestLoadSaveState:
         assert state.first_seen is None
         assert state.run_count == 0
 
+    def test_load_truncated_state(self, tmp_path, monkeypatch):
+        """Loading a state file cut off mid-object should return empty state."""
+        state_dir = tmp_path / ".life" / "state" / "scripts"
+        state_dir.mkdir(parents=True)
+        monkeypatch.setattr(
+            "life.scripts.state._state_dir", lambda: state_dir
+        )
+
+        (state_dir / "cut.json").write_text('{"run_count": 3, "first_')
+
+        state = load_state("cut")
+        assert state.run_count == 0
+
     def test_save_creates_directory(self, tmp_path, monkeypatch):
         """Save should create state directory if needed."""
         state_dir = tmp_path / "new" / "path" / "scripts"
@@ -112,6 +141,55 @@ class TestLoadSaveState:
         assert state_dir.exists()
         assert (state_dir / "test.json").exists()
 
+    def test_save_replaces_atomically(self, tmp_path, monkeypatch):
+        """Save should overwrite existing state and leave no temp file."""
+        state_dir = tmp_path / ".life" / "state" / "scripts"
+        monkeypatch.setattr(
+            "life.scripts.state._state_dir", lambda: state_dir
+        )
+
+        save_state("test", ScriptState(run_count=1))
+        save_state("test", ScriptState(run_count=2))
+
+        assert load_state("test").run_count == 2
+        assert sorted(p.name for p in state_dir.iterdir()) == ["test.json"]
+
+    def test_overlapping_saves_both_succeed(self, tmp_path, monkeypatch):
+        """A save that starts while another is mid-write should not clash."""
+        state_dir = tmp_path / ".life" / "state" / "scripts"
+        monkeypatch.setattr(
+            "life.scripts.state._state_dir", lambda: state_dir
+        )
+
+        real_fsync = os.fsync
+        nested = []
+
+        def fsync_with_overlap(fd):
+            # Run a second save while the first still has its temp file open
+            if not nested:
+                nested.append(True)
+                save_state("test", ScriptState(run_count=2))
+            real_fsync(fd)
+
+        monkeypatch.setattr("life.scripts.state.os.fsync", fsync_with_overlap)
+
+        save_state("test", ScriptState(run_count=1))
+
+        assert load_state("test").run_count == 1
+        assert sorted(p.name for p in state_dir.iterdir()) == ["test.json"]
+
+    def test_failed_save_removes_temp_file(self, tmp_path, monkeypatch):
+        """A write that fails should not leave a temp file behind."""
+        state_dir = tmp_path / ".life" / "state" / "scripts"
+        monkeypatch.setattr(
+            "life.scripts.state._state_dir", lambda: state_dir
+        )
+
+        with pytest.raises(TypeError):
+            save_state("test", ScriptState(first_seen=object()))
+
+        assert list(state_dir.iterdir()) == []
+
 
 class TestCalculateTier:
     """Tests for calculate_tier function."""
@@ -236,6 +314,14 @@ class TestCalculateTier:
         tier = calculate_tier(metadata, state)
         assert tier == ScriptTier.BLOCKED
 
+    def test_uses_supplied_now(self):
+        """An explicit now should be used instead of the wall clock."""
+        created = date.today() - timedelta(days=5)
+        metadata = self._make_metadata(created, ttl_days=30)
+        later = datetime.now(timezone.utc) + timedelta(days=40)
+
+        assert calculate_tier(metadata, ScriptState(), now=later) == ScriptTier.STALE
+
 
 class TestGetAgeDays:
     """Tests for get_age_days function."""
@@ -273,6 +359,14 @@ class TestGetAgeDays:
         age = get_age_days(metadata, state)
         assert age == 10  # Uses first_seen because it's more recent
 
+    def test_age_uses_supplied_now(self):
+        """Should measure age against an explicit now."""
+        created = date.today() - timedelta(days=15)
+        metadata = self._make_metadata(created)
+        later = datetime.now(timezone.utc) + timedelta(days=5)
+
+        assert get_age_days(metadata, ScriptState(), now=later) == 20
+
     def test_new_script_age_zero(self):
         """Script created today should have age 0."""
         metadata = self._make_metadata(date.today())
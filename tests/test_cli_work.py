@@ -6,10 +6,10 @@ These tests verify the CLI interface is preserved and commands raise NotImplemen
 
 from __future__ import annotations
 
+import pytest
 from typer.testing import CliRunner
 
-from life.cli import app
-
+pytestmark = pytest.mark.cli
 
 runner = CliRunner()
 
@@ -17,7 +17,7 @@ runner = CliRunner()
 class TestWorkCreate:
     """Tests for life work create command."""
 
-    def test_create_raises_not_implemented(self, monkeypatch):
+    def test_create_raises_not_implemented(self, app, monkeypatch):
         """work create should raise NotImplementedError with clear message."""
         monkeypatch.setenv("LIFE_ACTOR", "testuser")
 
@@ -27,7 +27,7 @@ class TestWorkCreate:
         assert isinstance(result.exception, NotImplementedError)
         assert "pending lorchestra" in str(result.exception)
 
-    def test_create_invalid_kind_still_validates(self, monkeypatch):
+    def test_create_invalid_kind_still_validates(self, app, monkeypatch):
         """Invalid kind should still error with helpful message before NotImplementedError."""
         monkeypatch.setenv("LIFE_ACTOR", "testuser")
 
@@ -37,7 +37,7 @@ class TestWorkCreate:
         assert "Invalid kind" in result.output
         assert "TASK" in result.output  # Should list valid kinds
 
-    def test_create_help_still_works(self):
+    def test_create_help_still_works(self, app):
         """work create --help should display help without errors."""
         result = runner.invoke(app, ["work", "create", "--help"])
 
@@ -49,7 +49,7 @@ class TestWorkCreate:
 class TestWorkComplete:
     """Tests for life work complete command."""
 
-    def test_complete_raises_not_implemented(self, monkeypatch):
+    def test_complete_raises_not_implemented(self, app, monkeypatch):
         """work complete should raise NotImplementedError with clear message."""
         monkeypatch.setenv("LIFE_ACTOR", "testuser")
 
@@ -59,7 +59,7 @@ class TestWorkComplete:
         assert isinstance(result.exception, NotImplementedError)
         assert "pending lorchestra" in str(result.exception)
 
-    def test_complete_help_still_works(self):
+    def test_complete_help_still_works(self, app):
         """work complete --help should display help without errors."""
         result = runner.invoke(app, ["work", "complete", "--help"])
 
@@ -70,7 +70,7 @@ class TestWorkComplete:
 class TestWorkMove:
     """Tests for life work move command."""
 
-    def test_move_raises_not_implemented(self, monkeypatch):
+    def test_move_raises_not_implemented(self, app, monkeypatch):
         """work move should raise NotImplementedError with clear message."""
         monkeypatch.setenv("LIFE_ACTOR", "testuser")
 
@@ -83,14 +83,14 @@ class TestWorkMove:
         assert isinstance(result.exception, NotImplementedError)
         assert "pending lorchestra" in str(result.exception)
 
-    def test_move_requires_to_project(self):
+    def test_move_requires_to_project(self, app):
         """work move should require --to-project option."""
         result = runner.invoke(app, ["work", "move", "wi_01HZYTEST"])
 
         assert result.exit_code == 2  # Typer exits with 2 for missing required option
         assert "--to-project" in result.output or "Missing" in result.output
 
-    def test_move_help_still_works(self):
+    def test_move_help_still_works(self, app):
         """work move --help should display help without errors."""
         result = runner.invoke(app, ["work", "move", "--help"])
 
@@ -101,7 +101,7 @@ class TestWorkMove:
 class TestWorkHelp:
     """Tests for work command help."""
 
-    def test_work_help_still_works(self):
+    def test_work_help_still_works(self, app):
         """work --help should display help without errors."""
         result = runner.invoke(app, ["work", "--help"])
 
@@ -3,9 +3,10 @@
 
 """Tests for config command."""
 
+import pytest
 from typer.testing import CliRunner
 
-from life.cli import app
+pytestmark = pytest.mark.cli
 
 runner = CliRunner()
 
@@ -13,7 +14,7 @@ runner = CliRunner()
 class TestConfigValidate:
     """Test config validate command."""
 
-    def test_validate_with_valid_config(self, tmp_path):
+    def test_validate_with_valid_config(self, app, tmp_path):
         """Test validate command with valid config."""
         config_file = tmp_path / "life.yml"
         config_file.write_text(
@@ -31,7 +32,7 @@ sync:
         assert "Configuration structure is valid" in result.stdout
         assert "Tool Availability:" in result.stdout
 
-    def test_validate_with_invalid_config(self, tmp_path):
+    def test_validate_with_invalid_config(self, app, tmp_path):
         """Test validate command with invalid config."""
         config_file = tmp_path / "life.yml"
         config_file.write_text(
@@ -48,7 +49,7 @@ sync:
         # Should fail due to missing command
         assert "Structure Issues:" in result.stdout
 
-    def test_validate_with_missing_tool(self, tmp_path):
+    def test_validate_with_missing_tool(self, app, tmp_path):
         """Test validate command with missing tool."""
         config_file = tmp_path / "life.yml"
         config_file.write_text(
@@ -70,7 +71,7 @@ sync:
 class TestConfigCheck:
     """Test config check command."""
 
-    def test_check_with_installed_tools(self, tmp_path):
+    def test_check_with_installed_tools(self, app, tmp_path):
         """Test check command with installed tools."""
         config_file = tmp_path / "life.yml"
         config_file.write_text(
@@ -86,7 +87,7 @@ sync:
         assert result.exit_code == 0
         assert "All tools are available" in result.stdout
 
-    def test_check_with_missing_tools(self, tmp_path):
+    def test_check_with_missing_tools(self, app, tmp_path):
         """Test check command with missing tools."""
         config_file = tmp_path / "life.yml"
         config_file.write_text(
@@ -106,7 +107,7 @@ sync:
 class TestConfigList:
     """Test config list command."""
 
-    def test_list_tasks(self, tmp_path):
+    def test_list_tasks(self, app, tmp_path):
         """Test list command showing all tasks."""
         config_file = tmp_path / "life.yml"
         config_file.write_text(
@@ -156,7 +157,7 @@ status:
         # Check incremental marker
         assert "Incremental: Yes" in result.stdout
 
-    def test_list_empty_config(self, tmp_path):
+    def test_list_empty_config(self, app, tmp_path):
         """Test list command with empty config."""
         config_file = tmp_path / "life.yml"
         config_file.write_text("workspace: ~/test\n")
@@ -168,7 +169,7 @@ status:
 class TestConfigTools:
     """Test config tools command."""
 
-    def test_tools_command(self, tmp_path):
+    def test_tools_command(self, app, tmp_path):
         """Test tools command listing registered tools."""
         config_file = tmp_path / "life.yml"
         config_file.write_text("workspace: ~/test\n")
@@ -10,8 +10,6 @@ These tests verify:
 4. Execution reads templates and passes content to lorchestra
 """
 
-import pytest
-
 from life.compiler import compile_job, load_job_yaml
 from life.executor import execute
 
@@ -27,6 +25,13 @@ class TestEmailSendJobDef:
         assert len(job_def["steps"]) == 1
         assert job_def["steps"][0]["op"] == "lorchestra.run"
 
+    def test_load_returns_independent_copies(self):
+        """Mutating a loaded JobDef should not affect later loads."""
+        job_def = load_job_yaml("email.send")
+        job_def["steps"].clear()
+
+        assert len(load_job_yaml("email.send")["steps"]) == 1
+
     def test_compile_email_send(self):
         """Should compile email.send with payload."""
         job_def = load_job_yaml("email.send")